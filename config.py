@@ -6,7 +6,6 @@ import subprocess
 import matplotlib.pyplot as plt
 import numpy as np
 import re
-import pandas as pd
 
 from matplotlib.gridspec import GridSpec
 from matplotlib.colors import LinearSegmentedColormap
@@ -43,6 +42,10 @@ radius = 10
 # Whether to limit the data to particles above a given velocity threshold
 limit_Data = False
 
+# Whether to render sections as a binned mean-velocity pixel grid (imshow)
+# instead of one scatter marker per particle; much faster for dense sections
+aggregate_plot = False
+
 # Velocity threshold limit for filtering particle data
 limit = 0.03
 
@@ -1,5 +1,36 @@
 from config import *
 
+import math
+import mmap
+
+
+# Compiled once at import time: matching per line with string-literal patterns
+# forces a re-cache lookup on every call, and the vector/velocity patterns were
+# searched twice per line (once to validate, once to extract).
+# '.' does not cross newlines, so one findall over a whole section still
+# matches line-wise; the leading literal keeps only Blueprint messages.
+# Bytes mode so the mmapped file is never UTF-8 decoded.
+_LINE_RE = re.compile(
+    rb'LogBlueprintUserMessages.*?'
+    rb'KEY:\s*\d+.*?'
+    rb'VECTOR:\s*X=[-.\d]+\s+Y=([-.\d]+)\s+Z=([-.\d]+).*?'
+    rb'VELOCITY:\s*([-.\d]+).*?'
+    rb'XS(\d+)'
+)
+
+# Per-column unit scaling: Y, Z and velocity come in cm from the log and
+# are converted to m in one broadcast multiply; XS stays untouched.
+_SCALE = np.array([0.01, 0.01, 0.01, 1.0])
+
+# Maps the raw XS value from the log to (first key, second key, section
+# threshold): sections below the threshold belong to the first key.
+_XS_TABLE = {
+    1: (11, 12, 20),
+    4: (41, 42, 40),
+    2: (21, 22, 50),
+    3: (31, 32, 60),
+}
+
 
 class ParticleAttibuteCalculator:
     """
@@ -11,10 +42,10 @@ class ParticleAttibuteCalculator:
         Extracts valid particle data from a section.
 
         Args:
-            section (list): List of strings representing lines from a section.
+            section (bytes): Raw text of one section of the log file.
 
         Returns:
-            np.ndarray: Array of valid particle data.
+            tuple: (np.ndarray of valid particle data, raw XS value).
         """
         return self.extract_valid_particles(section)
 
@@ -22,22 +53,35 @@ class ParticleAttibuteCalculator:
         """
         Reads the file and splits its content into sections based on "STOP" markers.
 
-        :return: List of sections, each containing lines from the file.
-        """
+        :return: List of sections, each a bytes-like view of one section.
+        """
+        # mmap instead of a buffered read: pages come straight from the page
+        # cache with no extra copy, and madvise hints sequential access
+        with open(get_file_path(), 'rb') as file:
+            try:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # empty file or platform without mmap support
+                return file.read().split(b"STOP")
+        if hasattr(mm, 'madvise'):  # not available on Windows
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        # keep the map alive for as long as the zero-copy section views below
+        # are in use; the regex engine matches memoryviews directly, so the
+        # section bytes are never copied out of the mapped pages
+        self._mm = mm
+        view = memoryview(mm)
+        # walk the STOP markers with mmap.find (C memmem) and take a view of
+        # each section directly on the map
         sections = []
-        current_section = []
-
-        with open(get_file_path(), 'r') as file:
-            for line in file:
-                if "STOP" in line:          #check if section is concluded
-                    sections.append(current_section)
-                    current_section = []
-                else:
-                    current_section.append(line)
-
-        if current_section:
-            sections.append(current_section)
-
+        start = 0
+        size = mm.size()
+        while start <= size:
+            stop = mm.find(b"STOP", start)
+            if stop < 0:
+                sections.append(view[start:])
+                break
+            sections.append(view[start:stop])
+            start = stop + len(b"STOP")
         return sections
 
     def extract_valid_particles(self, section):
@@ -45,96 +89,82 @@ class ParticleAttibuteCalculator:
         Filters and parses valid particles from the section.
 
         Args:
-            section (list): List of lines to analyze.
-
-        Returns:
-            np.ndarray: Array containing valid particles with attributes [Y, Z, Velocity, XS].
-        """
-        valid_particles = [self.parse_line(line) for line in section if "LogBlueprintUserMessages" in line]
-        return np.array([particle for particle in valid_particles if particle])
-
-    def parse_line(self, line):
-        """
-        Parses a line to extract valid particle data.
-
-        Args:
-            line (str): String containing particle data.
-
-        Returns:
-            list or None: [Y, Z, Velocity, XS] if valid, otherwise None.
-        """
-
-        # check for matches in red line
-        key_match = re.search(r'KEY: \d+', line)
-        vector_match = re.search(r'VECTOR: X=[-.\d]+ Y=[-.\d]+ Z=[-.\d]+', line)
-        velocity_match = re.search(r'VELOCITY: [-.\d]+', line)
-        xs_match = re.search(r"XS(\d+)", line)
-
-        #extract data from lines
-        if key_match and vector_match and velocity_match and xs_match:
-            y, z = self.extract_vector_components(line)
-            velocity = self.extract_velocity(line)
-            xs_value = int(xs_match.group(1))
-            return [y, z, velocity, xs_value]
-        return None
-
-    def extract_vector_components(self, line):
-        """
-        Extracts Y and Z components from a vector string.
-
-        Args:
-            line (str): String containing vector information.
+            section (bytes): Raw section text to analyze.
 
         Returns:
-            tuple: (Y, Z) values as floats.
-        """
-        y_match = re.search(r'Y=([-\d.]+)', line)
-        z_match = re.search(r'Z=([-\d.]+)', line)
-        return float(y_match.group(1)) / 100, float(z_match.group(1)) / 100
+            tuple: (np.ndarray of valid particles with attributes
+                [Y, Z, Velocity, XS], raw XS value of the section or None).
+        """
+        # one findall over the section text keeps the matching loop in C;
+        # the captured strings convert to floats in a single np.array call
+        matches = _LINE_RE.findall(section)
+        if not matches:
+            # keep the (N, 4) shape even when empty so callers can slice
+            return np.empty((0, 4)), None
+        data = np.array(matches, dtype=np.float64)
+        data *= _SCALE                  # cm -> m in a single broadcast pass
+        np.round(data[:, 2], 3, out=data[:, 2])
+        # the XS value is uniform within a section, so label it once here
+        # instead of re-deriving it from the array in every consumer
+        return data, int(data[0, 3])
 
-    def extract_velocity(self, line):
+    def calculate_average_velocity(self, data):
         """
-        Extracts velocity value from a line.
+        Calculates the average velocity of particles.
 
         Args:
-            line (str): String containing velocity information.
+            data (np.ndarray): Array of particle data with velocities in the 3rd column.
 
         Returns:
-            float: Velocity value.
+            float: Average velocity rounded to 3 decimal places.
         """
-        velocity_match = re.search(r'VELOCITY: [-.\d]+', line)
-        return round(float(velocity_match.group(0).split(": ")[1]) / 100, 3)
+        # the ndarray method skips the np.mean function-dispatch overhead,
+        # which dominates for the small per-section slices
+        return round(data[:, 2].mean(), 3) if data.size > 0 else 0
 
-    def calculate_average_velocity(self, data):
+    def calculate_standard_deviation(self, data):
         """
-        Calculates the average velocity of particles.
+        Calculates the standard deviation of particle velocities.
 
         Args:
             data (np.ndarray): Array of particle data with velocities in the 3rd column.
 
         Returns:
-            float: Average velocity rounded to 3 decimal places.
+            float: Standard deviation rounded to 3 decimal places.
         """
-        return round(np.mean(data[:, 2]), 3) if data.size > 0 else 0
+        return round(data[:, 2].std(), 3) if data.size > 0 else 0
 
-    def calculate_standard_deviation(self, data):
+    def calculate_velocity_stats(self, data):
         """
-        Calculates the standard deviation of particle velocities.
+        Calculates average and standard deviation of velocities in one pass.
+
+        Fuses the two separate reductions so the velocity column is
+        traversed once (sum plus dot product) instead of the three passes
+        a mean followed by a centered std requires.
 
         Args:
             data (np.ndarray): Array of particle data with velocities in the 3rd column.
 
         Returns:
-            float: Standard deviation rounded to 3 decimal places.
+            tuple: (average, standard deviation), both rounded to 3 decimal places.
         """
-        return round(np.std(data[:, 2]), 3) if data.size > 0 else 0
+        if data.size == 0:
+            return 0, 0
+        velocities = data[:, 2]
+        n = velocities.size
+        mean = velocities.sum() / n
+        # E[v^2] - mean^2; clamp against tiny negative rounding errors
+        variance = np.dot(velocities, velocities) / n - mean * mean
+        sd = math.sqrt(variance) if variance > 0 else 0.0
+        return round(float(mean), 3), round(sd, 3)
 
-    def calculate_average_particle_count(self, sections):
+    def calculate_average_particle_count(self, parsed_sections):
         """
         Calculates the average number of particles for each cross-section (XS).
 
         Args:
-            sections (list): List of sections containing particle data.
+            parsed_sections (list): (particle array, raw XS value) tuples,
+                one per section.
 
         Returns:
             dict: Dictionary with average particle counts for each XS category.
@@ -142,12 +172,11 @@ class ParticleAttibuteCalculator:
         xs_totals = {11: 0, 41: 0, 21: 0, 31: 0, 12: 0, 42: 0, 22: 0, 32: 0}
         xs_counts = {11: 0, 41: 0, 21: 0, 31: 0, 12: 0, 42: 0, 22: 0, 32: 0}
 
-        for section_number, section in enumerate(sections, start=1):
-            data = self.extract_valid_particles(section)
+        for section_number, (data, xs_raw) in enumerate(parsed_sections, start=1):
             valid_particle_count = len(data)
 
             if valid_particle_count > 0:
-                xs_key = self.determine_xs(data, section_number)
+                xs_key = self.determine_xs(xs_raw, section_number)
                 if xs_key in xs_totals:
                     xs_totals[xs_key] += valid_particle_count       #sum up all valid particles
                     xs_counts[xs_key] += 1
@@ -160,30 +189,25 @@ class ParticleAttibuteCalculator:
                 xs_averages[xs_key] = 0
         return xs_averages
 
-    def determine_xs(self, data, section_number):
+    def determine_xs(self, xs_raw, section_number):
         """
-        Determines the cross-section (XS) key based on the mean XS value in the data and section number.
+        Determines the cross-section (XS) key based on the raw XS value and section number.
 
         The XS key is determined based on predefined thresholds related to section numbers.
 
         Args:
-            data (np.ndarray): Particle data array, where the fourth column contains XS values.
+            xs_raw (int): Raw XS value of the section, as labeled at parse time.
             section_number (int): The current section number.
 
         Returns:
             int or None: XS key (e.g., 11, 41) or None if no match is found.
         """
 
-        xs_value = int(data[:, 3].mean())  # Get the XS value
-        if xs_value == 1:
-            return 11 if section_number < 20 else 12
-        elif xs_value == 4:
-            return 41 if section_number < 40 else 42
-        elif xs_value == 2:
-            return 21 if section_number < 50 else 22
-        elif xs_value == 3:
-            return 31 if section_number < 60 else 32
-        return None
+        entry = _XS_TABLE.get(xs_raw)
+        if entry is None:
+            return None
+        first_key, second_key, threshold = entry
+        return first_key if section_number < threshold else second_key
 
     def sum_global_var(self):
         """
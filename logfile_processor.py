@@ -2,6 +2,10 @@ from get_particle_attributes import *
 from plotter import *
 import sys
 import argparse
+import csv
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
 from config import set_file_path
 
 
@@ -9,6 +13,39 @@ from config import set_file_path
 DEFAULT_LOGFILE = "VSF-logfile-example.py"  # "logfile-data/HQ100.log"
 MODE = "normal"  # "normal" to plot with axes; "qualitative" to plot without axes
 
+# Column order of Values.csv
+CSV_FIELDS = ["xs", "valid_particle_count", "avg_particle", "sd_velocity", "avg_velocity"]
+
+
+# One Plotter per worker process so each worker reuses its figure and Agg
+# canvas across all sections it renders
+_worker_plotter = None
+
+
+def _init_worker(plot_axis):
+    """
+    Builds the per-process Plotter once when the worker starts.
+
+    Args:
+        plot_axis (bool): Whether the section plots should show axes.
+    """
+    global _worker_plotter
+    _worker_plotter = Plotter(plot_axis)
+
+
+def _render_section(job):
+    """
+    Renders one section plot inside a worker process.
+
+    Args:
+        job (tuple): (data, avg_particle, sd_velocity, valid_particle_count,
+            avg_velocity, section_number, left_value, right_value).
+    """
+    (data, avg_particle, sd_velocity, valid_particle_count, avg_velocity,
+     section_number, left_value, right_value) = job
+    _worker_plotter(data, avg_particle, sd_velocity, valid_particle_count,
+                    avg_velocity, section_number, left_value, right_value)
+
 
 class LogFileProcessor:
     """
@@ -24,7 +61,15 @@ class LogFileProcessor:
         mode : bool
             Defaults is "normal". If set to "qualitative", no axis will be plotted.
         """
-        self.data_list: list = []
+        # rows are streamed to Values.csv as they are computed; only small
+        # running aggregates stay in memory, so memory use is constant in
+        # the number of sections
+        self._csv_writer = None
+        self._head_rows: list = []      # first five rows for the summary print
+        self._top_sd_rows: list = []    # bounded min-heap of the five highest sd rows
+        self._sd_sum: float = 0.0
+        self._sd_count: int = 0
+        self._render_jobs: list = []
         if mode == "normal":
             self.plot_axis = True
         else:
@@ -37,71 +82,107 @@ class LogFileProcessor:
         """
 
         particle_attributes = ParticleAttibuteCalculator()
-        plotter = Plotter(self.plot_axis)
 
         sections = particle_attributes.extract_sections()
 
-        # Calculate average particle counts using the new method
-        avg_particles = particle_attributes.calculate_average_particle_count(sections)
+        # Parse every section exactly once; both the particle-count averages
+        # and the per-section processing below reuse the same arrays and
+        # the XS label captured at parse time
+        parsed_sections = [particle_attributes.extract_valid_particles(section)
+                           for section in sections]
 
-        # Process each section and generate plots
-        for section_number, section in enumerate(sections, start=1):
-            self.process_section(section, particle_attributes, plotter, avg_particles, section_number)
-
-        self.calculate_pandas_values()
+        # Calculate average particle counts using the new method
+        avg_particles = particle_attributes.calculate_average_particle_count(parsed_sections)
+
+        # Process each section, streaming the statistics row of each section
+        # straight to the CSV; plots are collected as jobs and rendered below
+        with open('Values.csv', 'w', newline='') as csv_file:
+            self._csv_writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS,
+                                              lineterminator='\n')
+            self._csv_writer.writeheader()
+            for section_number, (data, xs_raw) in enumerate(parsed_sections, start=1):
+                self.process_section(data, xs_raw, particle_attributes, avg_particles,
+                                     section_number)
+            self._csv_writer = None
+
+        # Sections are independent once parsed, so rendering and PNG encoding
+        # fan out across all cores
+        if self._render_jobs:
+            with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                     initializer=_init_worker,
+                                     initargs=(self.plot_axis,)) as executor:
+                list(executor.map(_render_section, self._render_jobs))
+
+        self.print_summary_values()
         particle_attributes.sum_global_var()
-        plotter.subtract_global_var()
+        Plotter.subtract_global_var()
 
-    def calculate_pandas_values(self):
+    def print_summary_values(self):
         """
-        Processes collected particle data using Pandas for statistical analysis and storage.
+        Prints summary statistics from the aggregates collected while streaming.
 
         Args:
-            None (Relies on self.data_list, which contains processed section data.)
+            None (Relies on the running aggregates updated in process_section.)
 
         Returns:
-            None (Outputs results to a CSV file and prints key statistical values.)
+            None (The CSV was already written incrementally; this prints key values.)
         """
-        df = pd.DataFrame(self.data_list)
-        df_sorted = df.sort_values(by=['sd_velocity'], ascending=False)
-        mean_value = df['sd_velocity'].mean()
-        df.to_csv('Values.csv', index=False)
-        print(df.head(5))
+        for row in self._head_rows:
+            print(row)
+        mean_value = self._sd_sum / self._sd_count if self._sd_count else 0
         print("mean sd_velocity: " + str(mean_value))
-        print(df_sorted.head(5))
+        for _, _, row in sorted(self._top_sd_rows, reverse=True):
+            print(row)
 
-    def setup_section(self, section, particle_attributes):
+    def record_section_stats(self, row, section_number):
         """
-        Processes a section of data to extract relevant particle information.
+        Streams one statistics row to the CSV and updates the running aggregates.
 
         Args:
-            section (list): List of strings representing a section of the log file.
+            row (dict): Statistics of one section, keyed by CSV_FIELDS.
+            section_number (int): Section number the row belongs to.
+        """
+        self._csv_writer.writerow(row)
+        if len(self._head_rows) < 5:
+            self._head_rows.append(row)
+        # bounded heap keeps only the five highest-sd rows resident; the
+        # section number breaks ties so the dicts are never compared
+        entry = (row["sd_velocity"], -section_number, row)
+        if len(self._top_sd_rows) < 5:
+            heapq.heappush(self._top_sd_rows, entry)
+        elif entry > self._top_sd_rows[0]:
+            heapq.heapreplace(self._top_sd_rows, entry)
+        self._sd_sum += row["sd_velocity"]
+        self._sd_count += 1
+
+    def setup_section(self, data, particle_attributes):
+        """
+        Summarizes the particle information of an already-parsed section.
+
+        Args:
+            data (np.ndarray): Parsed particle array of one section.
             particle_attributes (ParticeAttributeCalculator): Instance of the ParticleAttibuteCalculator class used for computations.
 
         Returns:
-            tuple: (data, valid_particle_count, avg_velocity, sd_velocity)
-                - data (list): Processed particle data extracted from the section.
+            tuple: (valid_particle_count, avg_velocity, sd_velocity)
                 - valid_particle_count (int): Number of valid particles in this section.
                 - avg_velocity (float): Average velocity of particles in this section.
                 - sd_velocity (float): Standard deviation of particle velocities.
         """
 
-        data = particle_attributes(section)
         valid_particle_count = len(data)
-        avg_velocity = particle_attributes.calculate_average_velocity(data)
-        sd_velocity = particle_attributes.calculate_standard_deviation(data)
+        avg_velocity, sd_velocity = particle_attributes.calculate_velocity_stats(data)
 
-        return data, valid_particle_count, avg_velocity, sd_velocity
+        return valid_particle_count, avg_velocity, sd_velocity
 
 
-    def create_pictures(self, data, plotter, avg_particle, sd_velocity, valid_particle_count,
+    def create_pictures(self, data, avg_particle, sd_velocity, valid_particle_count,
                         avg_velocity, left_value, right_value, section_number):
         """
-        Generates and saves plots for a given section of particle data.
+        Queues a render job for a given section of particle data.
 
         Args:
             data (list): List of particle data points.
-            plotter (Plotter): Instance of the Plotter class used for visualization.
             avg_particle (float): Average number of particles in this section.
             sd_velocity (float): Standard deviation of particle velocities.
             valid_particle_count (int): Number of valid particles in this section.
@@ -111,23 +192,21 @@ class LogFileProcessor:
             section_number (int): The section number being processed.
         """
 
+        # filter before queueing so less data is pickled to the workers
         if limit_Data:
-            reduced_data = plotter.reduce_particles(data, limit)
-            plotter(reduced_data, avg_particle, sd_velocity, valid_particle_count, avg_velocity,
-                    section_number, left_value, right_value)
-        else:
-            plotter(data, avg_particle, sd_velocity, valid_particle_count, avg_velocity,
-                    section_number, left_value, right_value)
+            data = Plotter.reduce_particles(data, limit)
+        self._render_jobs.append((data, avg_particle, sd_velocity, valid_particle_count,
+                                  avg_velocity, section_number, left_value, right_value))
 
 
-    def process_section(self, section, particle_attributes, plotter, avg_particles, section_number):
+    def process_section(self, data, xs_raw, particle_attributes, avg_particles, section_number):
         """
         Processes a single section of data.
 
         Args:
-            section (list): List of strings representing the section.
+            data (np.ndarray): Parsed particle array of the section.
+            xs_raw (int): Raw XS value of the section, labeled at parse time.
             particle_attributes (ParticleAttibuteCalculator): Instance of the ParticleAttibuteCalculator class.
-            plotter (Plotter): Instance of the Plotter class.
             avg_particles (list): Average particle count across sections.
             section_number (int): Section number being processed.
         """
@@ -136,13 +215,13 @@ class LogFileProcessor:
         # auxiliary component
         create_pictures = True
 
-        data,valid_particle_count, avg_velocity, sd_velocity = self.setup_section(
-            section,
+        valid_particle_count, avg_velocity, sd_velocity = self.setup_section(
+            data,
             particle_attributes
         )
 
         if valid_particle_count > 0:
-            current_xs = particle_attributes.determine_xs(data, section_number)
+            current_xs = particle_attributes.determine_xs(xs_raw, section_number)
             xs_limit = xs_limits.get(current_xs)
             if xs_limit is None:
                 print(f"Warning: No x-axis limits found for XS {current_xs}. Skipping section {section_number}.")
@@ -153,16 +232,16 @@ class LogFileProcessor:
             print(f'Section {section_number}: Count of valid particles: {valid_particle_count}')
             print(f'Section {section_number}: Average Velocity: {avg_velocity:.3f} m/s')
 
-            self.data_list.append({
+            self.record_section_stats({
                 "xs": current_xs,
                 "valid_particle_count": valid_particle_count,
                 "avg_particle": avg_particle,
                 "sd_velocity": sd_velocity,
                 "avg_velocity": avg_velocity
-            })
+            }, section_number)
 
             if create_pictures:
-                self.create_pictures(data, plotter, avg_particle, sd_velocity, valid_particle_count,
+                self.create_pictures(data, avg_particle, sd_velocity, valid_particle_count,
                                      avg_velocity, left_value, right_value, section_number)
 
 
@@ -5,17 +5,43 @@ from matplotlib.colors import Normalize
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
 from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.ticker import MultipleLocator, FuncFormatter
+from matplotlib.collections import CircleCollection
+from matplotlib.ticker import FixedFormatter, FixedLocator
+from matplotlib.transforms import IdentityTransform
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 
 
+# headless batch rendering; avoids any interactive backend overhead
+mpl.use("Agg")
+
 mpl.rcParams.update({
     "font.family": "Ubuntu",
     "font.weight": "light",
     "font.size": 10,
-    "figure.dpi": 500,
+    # working resolution for layout and interactive draws; all bbox and
+    # anti-aliasing math scales with dpi^2, so keep this moderate and only
+    # rasterize at full resolution when saving (see _SAVE_DPI)
+    "figure.dpi": 150,
 })
 
+# Output resolution of the saved PNGs
+_SAVE_DPI = 500
+
+# Tick steps are fixed; the positions and labels themselves depend only on
+# the section's axis extents and are precomputed in _set_ticks
+_X_TICK_STEP = 0.1
+_Y_TICK_STEP = 0.05
+
+# Colormap and normalization are fixed for the whole run, so resolve them
+# once at import time instead of per Plotter instance
+_CMAP = plt.get_cmap("turbo")
+_NORM = Normalize(vmin=0.0, vmax=2.0)
+# 256-entry RGBA lookup table sampled from the colormap: mapping velocities
+# becomes a quantize + integer gather instead of per-point float interpolation.
+# Stored as uint8 (256 x 4 bytes, one cache line per 16 entries) so the
+# gather stays cache-hot; divide back to 0..1 floats after the lookup.
+_CMAP_LUT_U8 = (_CMAP(np.linspace(0.0, 1.0, 256)) * 255).astype(np.uint8)
+
 
 class Plotter:
     """Generates scatter plots visualising particle data."""
@@ -28,6 +54,23 @@ class Plotter:
             Defaults is True. If set to False, no axis will be plotted.
         """
         self.plot_axis = plot_axis
+        # one figure reused for all sections: constructing and tearing down a
+        # Figure per call dominates the plotting cost for long runs
+        self._fig, self._ax, self._cbar_ax = self._setup_figure()
+        self._axes_initialized = False
+        # tight bbox cache, keyed by the (x_extent, y_extent) it was
+        # measured for: the equal-aspect axes box resizes with the data
+        # extents, so a bbox from one section would crop a taller one
+        self._save_bbox = None
+        self._save_bbox_key = None
+        self._extents = None
+        # colors are mapped once per section up front; the colorbar uses its
+        # own ScalarMappable with no data array attached, so creating it
+        # never re-normalizes the scatter points and the scatter itself is
+        # never consulted for color limits
+        self._cmap = _CMAP
+        self._norm = _NORM
+        self._mappable = mpl.cm.ScalarMappable(norm=self._norm, cmap=self._cmap)
 
     def __call__(self,
                  data,
@@ -55,13 +98,22 @@ class Plotter:
                   section_number: int):
         """Main routine for assembling the figure."""
 
-        fig, ax_scatter, ax_cbar = self._setup_figure()
+        fig, ax_scatter = self._fig, self._ax
+        # only the data artists change between sections; labels, grid, tick
+        # machinery and the colorbar are configured once and survive, which
+        # is much cheaper than a full cla() + reformat per call
+        for artist in list(ax_scatter.collections) + list(ax_scatter.images):
+            artist.remove()
+        if not self._axes_initialized:
+            self._format_axes(ax_scatter)
+            if self.plot_axis:
+                # the colorbar is data independent, so once is enough
+                self._add_colorbar(fig, ax_scatter)
+            else:
+                # used for comparison with OpenFOAM
+                ax_scatter.set_axis_off()
+            self._axes_initialized = True
         self._scatter(ax_scatter, data)
-        if self.plot_axis:
-            self._add_colorbar(fig, ax_scatter)
-        else:
-            # used for comparison with OpenFOAM
-            ax_scatter.set_axis_off()
         if self.print_stats_on_plot:
             self._add_title(
                 fig,
@@ -83,53 +135,158 @@ class Plotter:
 
     def _scatter(self, ax, data):
         """Scatter plot with velocity coloring and custom axes formatting."""
-        # Shift X so the minimum becomes 0, satisfying
-        x_raw = data[:, 0]
-        x = x_raw - x_raw.min()
-        y = data[:, 1]  # Elevation above channel bottom
-        vel = data[:, 2]
-
-        norm = Normalize(vmin=0.0, vmax=2.0)
-
-        # Color map and scatter
-        ax.scatter(x,
-                   y,
-                   c=vel,
-                   cmap="turbo",
-                   norm=norm,
-                   alpha=1.0,
-                   s=np.pi * (0.1 * radius) ** 2)
+        # Column slices of the row-major (N, 4) array stride over whole rows,
+        # so every reduction below would touch 4x the bytes it needs; one
+        # transpose copy up front yields unit-stride per-column views
+        xyv = np.ascontiguousarray(data.T)
+        # The x axis should start at 0 at the leftmost particle; instead of
+        # shifting the whole column (an 8N-byte copy plus N subtracts), plot
+        # the raw coordinates and shift the axis limits and tick labels
+        x = xyv[0]
+        x_min = float(x.min())
+        x_extent = float(x.max()) - x_min
+        y = xyv[1]  # Elevation above channel bottom
+        vel = xyv[2]
+
+        y_extent = float(y.max())
+        # _save keys its cached tight bbox on the extents, since they drive
+        # the equal-aspect axes layout
+        self._extents = (x_extent, y_extent)
+
+        if aggregate_plot:
+            # O(pixels) image instead of O(N) marker artists
+            self._draw_binned(ax, x, y, vel, x_min, x_extent)
+        else:
+            # particles landing on the same output pixel are invisible as
+            # individual markers, so draw one mean-velocity point per pixel
+            x, y, vel = self._collapse_to_pixels(x, y, vel, x_min, x_extent,
+                                                 y_extent)
+            # draw in velocity-bucket order: consecutive markers then share a
+            # LUT entry and blend color state, instead of thrashing between
+            # colormap entries point by point; stable so equal-color points
+            # keep their spatial order
+            order = np.argsort((vel * 128).astype(np.int32), kind='stable')
+            x, y, vel = x[order], y[order], vel[order]
+            # Pre-normalized RGBA: quantize to 8-bit LUT indices over the fixed
+            # 0..2 m/s range, then one integer gather; matplotlib never has to
+            # normalize or interpolate colors at draw time
+            indices = np.clip(vel * (255.0 / _NORM.vmax), 0, 255).astype(np.uint8)
+            rgba = _CMAP_LUT_U8[indices] / 255.0
+            # CircleCollection with one shared marker size skips scatter's
+            # per-point size broadcast and marker-path re-transformation
+            markers = CircleCollection(
+                sizes=(np.pi * (0.1 * radius) ** 2,),
+                offsets=np.column_stack((x, y)),
+                offset_transform=ax.transData,
+                facecolors=rgba,
+                edgecolors="face",
+                transform=IdentityTransform(),
+            )
+            ax.add_collection(markers)
 
+        # Axis limits and the matching tick labels are the only per-section
+        # formatting
+        ax.set_xlim(x_min, x_min + x_extent)
+        ax.set_ylim(0, y_extent)
+        self._set_ticks(ax, x_min, x_extent, y_extent)
+
+    @staticmethod
+    def _set_ticks(ax, x_min, x_extent, y_extent):
+        """Precomputed tick positions and labels for the section's extents.
+
+        A FuncFormatter runs a Python callback once per tick on every draw;
+        with the tick positions known from the axis limits, the label
+        strings can be built up front and handed over as fixed lists. The
+        x labels are relative to x_min, so the axis reads from 0 even
+        though the data keeps its raw coordinates.
+        """
+        # tick counts come from int division so a float-accumulated arange
+        # endpoint can never produce a stray tick beyond the axis limit
+        # X: only every 5th value labeled (e.g., 0.0, 0.5, 1.0, ...)
+        x_rel = np.arange(int(x_extent / _X_TICK_STEP) + 1) * _X_TICK_STEP
+        # bind the format method once per axis so the label loops skip the
+        # per-item global and attribute lookups
+        x_fmt = "{:.1f}".format
+        x_labels = [x_fmt(v) if (round(v * 10) % 5 == 0) else ""
+                    for v in x_rel]
+        ax.xaxis.set_major_locator(FixedLocator(x_min + x_rel))
+        ax.xaxis.set_major_formatter(FixedFormatter(x_labels))
+        # Y: only every 5th tick labeled (0.00, 0.05, 0.10, ...)
+        y_ticks = np.arange(int(y_extent / _Y_TICK_STEP) + 1) * _Y_TICK_STEP
+        y_fmt = "{:.2f}".format
+        y_labels = [y_fmt(v) if (round(v * 100) % 5 == 0) else ""
+                    for v in y_ticks]
+        ax.yaxis.set_major_locator(FixedLocator(y_ticks))
+        ax.yaxis.set_major_formatter(FixedFormatter(y_labels))
+
+    @staticmethod
+    def _format_axes(ax):
+        """One-time axes styling, shared by every section plot."""
         # Axis labels
         ax.set_xlabel("Channel width (m)")
         ax.set_ylabel("Elevation above bottom (m)")
 
-        # Axis limits
-        ax.set_xlim(0, x.max())
-        ax.set_ylim(0, y.max())
         ax.set_aspect('equal', adjustable='box')  # 1 unit x == 1 unit y
 
-        # Grid and tick layout
+        # Grid and tick layout; tick positions and labels are set per section
+        # in _set_ticks once the axis extents are known
         ax.grid(True, which="both", linestyle="--", color="grey", linewidth=0.4)
-        # X: only every 5th value labeled (e.g., 0.0, 0.5, 1.0, ...)
-        x_tick_step = 0.1
-        x_ticks = np.arange(0, x.max() + x_tick_step, x_tick_step)
-        def every_fifth_x(val, _):
-            return f"{val:.1f}" if np.isclose(val % 0.5, 0, atol=1e-8) else ""
-        ax.xaxis.set_major_locator(MultipleLocator(x_tick_step))
-        ax.xaxis.set_major_formatter(FuncFormatter(every_fifth_x))
-        # Y: only every 5th tick labeled (0.00, 0.05, 0.10, ...)
-        y_tick_step = 0.05
-        def every_fifth(val, _):
-            return f"{val:.2f}" if (round(val * 100) % 5 == 0) else ""
-        ax.yaxis.set_major_locator(MultipleLocator(y_tick_step))
-        ax.yaxis.set_major_formatter(FuncFormatter(every_fifth))
         # Thinner ticks, set ticks inside
         ax.tick_params(axis="both", labelsize=mpl.rcParams["font.size"], width=0.4, length=3, direction="in")
 
-    @staticmethod
-    def _add_colorbar(fig, ax_scatter):
-        mappable = ax_scatter.collections[0]  # uses Normalize(0, 2)
+    def _collapse_to_pixels(self, x, y, vel, x_min, x_extent, y_extent):
+        """Collapses particles that share an output pixel into one point.
+
+        Scatter cost grows linearly with the particle count even when many
+        points overplot the same pixel. Bucket the particles by their target
+        pixel at the figure's raster resolution and keep a single point per
+        occupied pixel, carrying the mean velocity of its particles.
+        """
+        width_px = max(int(self._fig.get_size_inches()[0] * _SAVE_DPI), 1)
+        height_px = max(int(self._fig.get_size_inches()[1] * _SAVE_DPI), 1)
+        px = np.minimum(((x - x_min) / (x_extent or 1.0) * width_px).astype(np.int64), width_px - 1)
+        py = np.minimum((y / (y_extent or 1.0) * height_px).astype(np.int64), height_px - 1)
+        keys = py * width_px + px
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        if len(unique_keys) == len(keys):
+            # no collisions: draw the particles as they are
+            return x, y, vel
+        counts = np.bincount(inverse)
+        mean_vel = np.bincount(inverse, weights=vel) / counts
+        mean_x = np.bincount(inverse, weights=x) / counts
+        mean_y = np.bincount(inverse, weights=y) / counts
+        return mean_x, mean_y, mean_vel
+
+    def _draw_binned(self, ax, x, y, vel, x_min, x_extent):
+        """Mean-velocity pixel grid, rendered as one image.
+
+        Bins the particles into a grid sized after the on-screen axes
+        resolution and shows the per-bin mean velocity with imshow; cells
+        without particles stay transparent. Rendering cost then scales with
+        the pixel count instead of the particle count.
+        """
+        x_extent = x_extent or 1.0
+        y_extent = float(y.max()) or 1.0
+        width_px, height_px = self._fig.get_size_inches() * _SAVE_DPI
+        # keep the grid aspect close to the data aspect (axes are equal-scaled)
+        nx = max(int(width_px), 1)
+        ny = max(int(nx * y_extent / x_extent), 1)
+        ix = np.minimum(((x - x_min) / x_extent * nx).astype(np.intp), nx - 1)
+        iy = np.minimum((y / y_extent * ny).astype(np.intp), ny - 1)
+        vel_sums = np.zeros((ny, nx))
+        counts = np.zeros((ny, nx))
+        np.add.at(vel_sums, (iy, ix), vel)
+        np.add.at(counts, (iy, ix), 1)
+        img = np.where(counts > 0, vel_sums / np.maximum(counts, 1), np.nan)
+        ax.imshow(img,
+                  origin='lower',
+                  extent=[x_min, x_min + x_extent, 0, y_extent],
+                  cmap=self._cmap,
+                  norm=self._norm,
+                  interpolation='nearest')
+
+    def _add_colorbar(self, fig, ax_scatter):
+        mappable = self._mappable  # uses Normalize(0, 2)
         cb_ax = inset_axes(
             ax_scatter,
             width="100%", height="50%",  # thin, full-width bar
@@ -167,18 +324,33 @@ class Plotter:
             y=0.01  # keep this low so it stays under the color‑bar row
         )
 
-    @staticmethod
-    def _save(fig, section_number: int):
+    def _save(self, fig, section_number: int):
         filename = f"section_plot_{section_number}.png"
-        fig.savefig(filename, format="png", bbox_inches="tight")
-        plt.close(fig)
+        # bbox_inches="tight" would draw the figure twice per save (once to
+        # measure, once to write); measure the tight box once per distinct
+        # extent pair and reuse it. The equal-aspect axes box follows the
+        # data extents, so sections sharing them share a layout, while a
+        # section with different extents forces a remeasure
+        if self._save_bbox is None or self._save_bbox_key != self._extents:
+            self._save_bbox = fig.get_tightbbox().padded(0.1)
+            self._save_bbox_key = self._extents
+        # the figure is reused for the next section, so no plt.close here;
+        # zlib level 1 encodes ~3x faster than the default 6 for slightly
+        # larger files, and optimize=False keeps Pillow from overriding the
+        # level with an exhaustive filter/compression search
+        fig.savefig(filename, format="png", dpi=_SAVE_DPI,
+                    bbox_inches=self._save_bbox,
+                    pil_kwargs={"compress_level": 1, "optimize": False})
 
     @staticmethod
     def reduce_particles(data: np.ndarray, limit: float):
         """Filter out particles with velocity below *limit*."""
         if data.size == 0:
             return data
-        return data[data[:, 2] >= limit]
+        # gather by integer indices: flatnonzero compacts the boolean mask to
+        # row indices first, so the take runs over exactly the kept rows
+        # instead of re-scanning the mask during fancy indexing
+        return data.take(np.flatnonzero(data[:, 2] >= limit), axis=0)
 
     @staticmethod
     def subtract_global_var():